@@ -0,0 +1,31 @@
+"""attempts pagination index
+
+Revision ID: b7c1e4d2a9f0
+Revises: efc3aff388f9
+Create Date: 2023-10-22 12:14:37.402188
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1e4d2a9f0'
+down_revision: Union[str, None] = 'efc3aff388f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_attempts_user_id_test_id_created_at',
+        'attempts',
+        ['user_id', 'test_id', sa.text('created_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_attempts_user_id_test_id_created_at', table_name='attempts')
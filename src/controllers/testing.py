@@ -1,15 +1,17 @@
-from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, BackgroundTasks
+from fastapi import APIRouter, Depends, BackgroundTasks, Query
 from fastapi import status as http_status
+from fastapi.exceptions import RequestValidationError
+from fastapi.requests import Request
+from pydantic import TypeAdapter, ValidationError
 
 from src.dependencies.services import get_services
 from src.models import schemas
 from src.models.language import ProgramLanguage
 from src.services import ServiceFactory
 from src.views.request import ApprovedRequestsResponse
-from src.views.testing import TestingsResponse, ProgramResultResponse
+from src.views.testing import TestingsResponse, TestingsBulkResponse, ProgramResultResponse
 from src.views.testing import PracticalQuestionsResponse
 from src.views.testing import TheoreticalQuestionsResponse
 from src.views.testing import AttemptTestResponse
@@ -20,6 +22,31 @@ from src.views.testing import AttemptsTestResponse
 
 router = APIRouter()
 
+# Ответы валидируются напрямую из байтов тела запроса Rust-парсером
+# pydantic-core, минуя цепочку json.loads -> dict -> model_validate
+_THEORETICAL_ANSWERS = TypeAdapter(list[schemas.AnswerToTheoreticalQuestion])
+_PRACTICAL_ANSWERS = TypeAdapter(list[schemas.AnswerToPracticalQuestion])
+
+
+def _as_body_errors(error: ValidationError) -> list[dict]:
+    # loc дополняется маркером body, как это делает сам FastAPI:
+    # иначе ошибки верхнего уровня приходят с пустым loc
+    return [{**e, "loc": ("body", *e["loc"])} for e in error.errors()]
+
+
+async def _theoretical_answers_from_body(request: Request) -> list[schemas.AnswerToTheoreticalQuestion]:
+    try:
+        return _THEORETICAL_ANSWERS.validate_json(await request.body())
+    except ValidationError as error:
+        raise RequestValidationError(_as_body_errors(error))
+
+
+async def _practical_answers_from_body(request: Request) -> list[schemas.AnswerToPracticalQuestion]:
+    try:
+        return _PRACTICAL_ANSWERS.validate_json(await request.body())
+    except ValidationError as error:
+        raise RequestValidationError(_as_body_errors(error))
+
 
 @router.post(
     "/practical/exec",
@@ -59,6 +86,23 @@ async def get_testing_list(vacancy_id: UUID, services: ServiceFactory = Depends(
     )
 
 
+@router.get("/list/bulk", response_model=TestingsBulkResponse, status_code=http_status.HTTP_200_OK)
+async def get_testing_list_bulk(
+        vacancy_ids: list[UUID] = Query(),
+        services: ServiceFactory = Depends(get_services)
+):
+    """
+    Получить списки тестирований сразу нескольких вакансий
+
+    Требуемое состояние: Active
+
+    Требуемые права доступа: GET_TESTING
+    """
+    return TestingsBulkResponse(
+        content=await services.testing.get_testings_bulk(vacancy_ids)
+    )
+
+
 @router.post("/new", response_model=TestingResponse, status_code=http_status.HTTP_201_CREATED)
 async def new_testing(vacancy_id: UUID, data: schemas.TestingCreate, services: ServiceFactory = Depends(get_services)):
     """
@@ -77,9 +121,8 @@ async def new_testing(vacancy_id: UUID, data: schemas.TestingCreate, services: S
 
 @router.get("/attempts", response_model=AttemptsTestResponse, status_code=http_status.HTTP_200_OK)
 async def get_self_attempts(
-        page: int = 1,
+        cursor: str = None,
         per_page: int = 10,
-        order_by: Literal["title", "created_at"] = "created_at",
         services: ServiceFactory = Depends(get_services)
 ):
     """
@@ -92,9 +135,8 @@ async def get_self_attempts(
     """
     return AttemptsTestResponse(
         content=await services.testing.get_test_attempts(
-            page=page,
-            per_page=per_page,
-            order_by=order_by
+            cursor=cursor,
+            per_page=per_page
         )
     )
 
@@ -102,9 +144,8 @@ async def get_self_attempts(
 @router.get("/{testing_id}/attempts", response_model=AttemptsTestResponse, status_code=http_status.HTTP_200_OK)
 async def get_self_testing_attempts(
         testing_id: UUID,
-        page: int = 1,
+        cursor: str = None,
         per_page: int = 10,
-        order_by: Literal["title", "created_at"] = "created_at",
         services: ServiceFactory = Depends(get_services)
 ):
     """
@@ -118,9 +159,8 @@ async def get_self_testing_attempts(
     return AttemptsTestResponse(
         content=await services.testing.get_test_attempts(
             testing_id=testing_id,
-            page=page,
-            per_page=per_page,
-            order_by=order_by
+            cursor=cursor,
+            per_page=per_page
         )
     )
 
@@ -229,8 +269,8 @@ async def start_theoretical_testing(testing_id: UUID, services: ServiceFactory =
 )
 async def finish_practical_testing(
         testing_id: UUID,
-        data: list[schemas.AnswerToPracticalQuestion],
         background_tasks: BackgroundTasks,
+        data: list[schemas.AnswerToPracticalQuestion] = Depends(_practical_answers_from_body),
         services: ServiceFactory = Depends(get_services)
 ):
     """
@@ -253,7 +293,7 @@ async def finish_practical_testing(
 )
 async def finish_theoretical_testing(
         testing_id: UUID,
-        data: list[schemas.AnswerToTheoreticalQuestion],
+        data: list[schemas.AnswerToTheoreticalQuestion] = Depends(_theoretical_answers_from_body),
         services: ServiceFactory = Depends(get_services)
 ):
     """
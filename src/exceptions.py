@@ -72,6 +72,12 @@ async def handle_pydantic_error(request, exc: RequestValidationError):
             message = "Поле является обязательным"
         elif error_type == "value_error":
             message = ", ".join(error['ctx']['error'].args)
+        elif error_type == "string_too_short":
+            message = "Поле не может быть пустым"
+        elif error_type == "string_too_long":
+            message = f"Поле не может содержать больше {error['ctx']['max_length']} символов"
+        elif error_type == "greater_than_equal":
+            message = f"Значение должно быть не меньше {error['ctx']['ge']}"
 
         content.append(
             FieldErrorItem(
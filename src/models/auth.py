@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 
 from starlette import authentication
 
-from src.models.permission import Permission
+from src.models.permission import Permission, permission_from_str
 from src.models.state import UserState
 
 
@@ -16,7 +16,7 @@ class BaseUser(ABC, authentication.BaseUser):
 
     @property
     @abstractmethod
-    def permissions(self) -> set[str]:
+    def permission_mask(self) -> int:
         pass
 
     @property
@@ -38,10 +38,15 @@ class BaseUser(ABC, authentication.BaseUser):
 
 
 class AuthenticatedUser(BaseUser):
-    def __init__(self, id: str, permissions: list[Permission], state_id: int, exp: int, **kwargs):
+    def __init__(self, id: str, permissions: list[str], state_id: int, exp: int, **kwargs):
         self._id = uuid.UUID(id)
-        self._permissions = permissions
+        mask = 0
+        for permission in map(permission_from_str, permissions):
+            if permission is not None:
+                mask |= permission
+        self._permission_mask = mask
         self._state_id = state_id
+        self._state = UserState(state_id)
         self._exp = exp
 
     @property
@@ -57,12 +62,12 @@ class AuthenticatedUser(BaseUser):
         return self._id
 
     @property
-    def permissions(self) -> set[Permission]:
-        return set(self._permissions)
+    def permission_mask(self) -> int:
+        return self._permission_mask
 
     @property
     def state(self) -> UserState:
-        return UserState(self._state_id)
+        return self._state
 
     @property
     def access_exp(self) -> int:
@@ -79,6 +84,8 @@ class AuthenticatedUser(BaseUser):
 
 
 class UnauthenticatedUser(BaseUser):
+    _permission_mask = int(Permission.GET_PUBLIC_VACANCY)
+
     def __init__(self, exp: int = None, **kwargs):
         self._exp = exp
 
@@ -95,10 +102,8 @@ class UnauthenticatedUser(BaseUser):
         return None
 
     @property
-    def permissions(self) -> set[str]:
-        return {
-            Permission.GET_PUBLIC_VACANCY.value,
-        }
+    def permission_mask(self) -> int:
+        return self._permission_mask
 
     @property
     def state(self) -> None:
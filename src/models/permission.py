@@ -1,22 +1,60 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class Permission(Enum):
-    GET_PUBLIC_VACANCY = "GET_PUBLIC_VACANCY"
+class Permission(IntEnum):
+    GET_PUBLIC_VACANCY = 1 << 0
 
     # User
-    GET_TESTING = "GET_TESTING"
-    START_TESTING = "START_TESTING"
-    COMPLETE_TESTING = "COMPLETE_TESTING"
-    GET_SELF_TEST_RESULTS = "GET_TEST_RESULTS"
+    GET_TESTING = 1 << 1
+    START_TESTING = 1 << 2
+    COMPLETE_TESTING = 1 << 3
+    GET_SELF_TEST_RESULTS = 1 << 4
 
     # HR
-    GET_PRIVATE_VACANCY = "GET_PRIVATE_VACANCY"
-    CREATE_VACANCY = "CREATE_VACANCY"
-    UPDATE_VACANCY = "UPDATE_VACANCY"
-    DELETE_VACANCY = "DELETE_VACANCY"
-
-    CREATE_TESTING = "CREATE_TESTING"
-    UPDATE_TESTING = "UPDATE_TESTING"
-    DELETE_TESTING = "DELETE_TESTING"
-    GET_USER_TEST_RESULTS = "GET_USER_TEST_RESULTS"
+    GET_PRIVATE_VACANCY = 1 << 5
+    CREATE_VACANCY = 1 << 6
+    UPDATE_VACANCY = 1 << 7
+    DELETE_VACANCY = 1 << 8
+
+    CREATE_TESTING = 1 << 9
+    UPDATE_TESTING = 1 << 10
+    DELETE_TESTING = 1 << 11
+    GET_USER_TEST_RESULTS = 1 << 12
+
+
+# Строковые значения claim'ов auth-сервиса остаются прежними,
+# внутри сервиса доступы представлены битовой маской
+_PERMISSION_BY_VALUE: dict[str, Permission] = {
+    "GET_PUBLIC_VACANCY": Permission.GET_PUBLIC_VACANCY,
+
+    "GET_TESTING": Permission.GET_TESTING,
+    "START_TESTING": Permission.START_TESTING,
+    "COMPLETE_TESTING": Permission.COMPLETE_TESTING,
+    "GET_TEST_RESULTS": Permission.GET_SELF_TEST_RESULTS,
+
+    "GET_PRIVATE_VACANCY": Permission.GET_PRIVATE_VACANCY,
+    "CREATE_VACANCY": Permission.CREATE_VACANCY,
+    "UPDATE_VACANCY": Permission.UPDATE_VACANCY,
+    "DELETE_VACANCY": Permission.DELETE_VACANCY,
+
+    "CREATE_TESTING": Permission.CREATE_TESTING,
+    "UPDATE_TESTING": Permission.UPDATE_TESTING,
+    "DELETE_TESTING": Permission.DELETE_TESTING,
+    "GET_USER_TEST_RESULTS": Permission.GET_USER_TEST_RESULTS,
+}
+
+_VALUE_BY_PERMISSION: dict[Permission, str] = {
+    permission: value for value, permission in _PERMISSION_BY_VALUE.items()
+}
+
+
+def permission_from_str(value: str) -> Permission | None:
+    """
+    O(1) разрешение строки из claim'а в Permission без Enum.__call__;
+    неизвестные этому сервису доступы дают None
+    """
+    return _PERMISSION_BY_VALUE.get(value)
+
+
+def permission_to_str(permission: Permission) -> str:
+    return _VALUE_BY_PERMISSION[permission]
@@ -19,6 +19,7 @@ from .testing import TestingUpdate
 
 from .attempt import Attempt
 from .attempt import AttemptTest
+from .attempt import AttemptTestPage
 
 from .questions import TheoreticalQuestion
 from .questions import TheoreticalQuestionCreate
@@ -23,3 +23,8 @@ class AttemptTest(Attempt):
 
     class Config:
         from_attributes = True
+
+
+class AttemptTestPage(BaseModel):
+    items: list[AttemptTest]
+    next_cursor: str | None = None
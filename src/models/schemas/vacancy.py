@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.file_type import FileType
 from src.models.schemas.s3 import PreSignedPostUrl
@@ -20,8 +20,7 @@ class Vacancy(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VacancySmall(BaseModel):
@@ -34,62 +33,24 @@ class VacancySmall(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VacancyCreate(BaseModel):
-    title: str
-    content: str
+    title: str = Field(min_length=1, max_length=255)
+    content: str = Field(min_length=1, max_length=32000)
     type: VacancyType
     state: VacancyState
-    test_time: int
-
-    @field_validator('content')
-    def content_must_be_valid(cls, value):
-        if not value:
-            raise ValueError("Публикация не может быть пустой")
-
-        if len(value) > 32000:
-            raise ValueError("Публикация не может содержать более 32000 символов")
-        return value
+    test_time: int = Field(ge=0)
 
-    @field_validator('title')
-    def title_must_be_valid(cls, value):
-        if not value:
-            raise ValueError("Заголовок не может быть пустым")
-
-        if len(value) > 255:
-            raise ValueError("Заголовок не может содержать больше 255 символов")
-        return value
-
-    @field_validator('test_time')
-    def test_time_must_be_valid(cls, value):
-        if value < 0:
-            raise ValueError("Время теста не может быть отрицательным")
-        return value
-    
 
 class VacancyUpdate(BaseModel):
-    title: str = None
-    content: str = None
-    state: VacancyState = None
-    type: VacancyType = None
-
-    class Config:
-        extra = 'ignore'
-
-    @field_validator('content')
-    def content_must_be_valid(cls, value):
-        if value and len(value) > 32000:
-            raise ValueError("Публикация не может содержать больше 32000 символов")
-        return value
+    title: str | None = Field(default=None, max_length=255)
+    content: str | None = Field(default=None, max_length=32000)
+    state: VacancyState | None = None
+    type: VacancyType | None = None
 
-    @field_validator('title')
-    def title_must_be_valid(cls, value):
-        if value and len(value) > 255:
-            raise ValueError("Заголовок не может содержать больше 255 символов")
-        return value
+    model_config = ConfigDict(extra='ignore')
 
 
 class VacancyFile(BaseModel):
@@ -102,8 +63,7 @@ class VacancyFile(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VacancyFileItem(BaseModel):
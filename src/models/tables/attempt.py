@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, UUID, DateTime, func, ForeignKey, INTEGER
+from sqlalchemy import Column, UUID, DateTime, func, ForeignKey, INTEGER, Index
 from sqlalchemy.orm import relationship
 
 from src.db import Base
@@ -23,5 +23,9 @@ class Attempt(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        Index("ix_attempts_user_id_test_id_created_at", user_id, test_id, created_at.desc()),
+    )
+
     def __repr__(self):
         return f'<{self.__class__.__name__}: {self.id}>'
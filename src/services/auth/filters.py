@@ -15,6 +15,12 @@ def permission_filter(*tags: Permission):
     """
 
     def decorator(func):
+        # Требуемая маска вычисляется один раз при декорировании,
+        # а не на каждый запрос
+        required_mask = 0
+        for tag in tags:
+            required_mask |= tag
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
 
@@ -23,7 +29,7 @@ def permission_filter(*tags: Permission):
             if not current_user:
                 raise ValueError('AuthMiddleware not found')
 
-            if {tag.value for tag in tags}.issubset(current_user.permissions):
+            if current_user.permission_mask & required_mask == required_mask:
                 return await func(*args, **kwargs)
 
             raise AccessDenied('У Вас нет прав для выполнения этого действия')
@@ -35,7 +41,9 @@ def permission_filter(*tags: Permission):
 
 def state_filter(*states: UserState):
     if not states:
-        states = [state for state in UserState]
+        states = tuple(UserState)
+
+    allowed = frozenset(states)
 
     def decorator(func):
         @wraps(func)
@@ -45,7 +53,7 @@ def state_filter(*states: UserState):
             if not current_user:
                 raise ValueError('AuthMiddleware not found')
 
-            if current_user.state in states:
+            if current_user.state in allowed:
                 return await func(*args, **kwargs)
             else:
                 raise AccessDenied('У Вас нет прав для выполнения этого действия')
@@ -1,11 +1,15 @@
 from src.models.auth import UnauthenticatedUser
-from src.models.permission import Permission
+from src.models.permission import Permission, permission_to_str
 
 
 class PermissionApplicationService:
 
     async def guest_permissions(self) -> list[str]:
-        return list(UnauthenticatedUser().permissions)
+        guest_mask = UnauthenticatedUser().permission_mask
+        return [
+            permission_to_str(access) for access in Permission
+            if guest_mask & access
+        ]
 
     async def app_permissions(self) -> list[str]:
-        return [access.value for access in Permission]
+        return [permission_to_str(access) for access in Permission]
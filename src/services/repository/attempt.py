@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, text, func, or_, and_, case
+from sqlalchemy import select, text, func, or_, and_, case, tuple_
 from sqlalchemy.orm import subqueryload, joinedload
 
 from src.models import tables
@@ -79,6 +80,25 @@ class AttemptRepo(BaseRepository[tables.Attempt]):
         result = (await self._session.execute(req.order_by(text(order_by)).limit(limit).offset(offset))).unique()
         return result.scalars().all()
 
+    async def get_page(
+            self,
+            limit: int = 100,
+            after: tuple[datetime, UUID] = None,
+            as_full: bool = False,
+            **kwargs
+    ) -> list[tables.Attempt]:
+        req = select(self.table).filter_by(**kwargs)
+        if as_full:
+            req = req.options(joinedload(self.table.test))
+
+        if after is not None:
+            req = req.where(tuple_(self.table.created_at, self.table.id) < after)
+
+        result = (await self._session.execute(
+            req.order_by(self.table.created_at.desc(), self.table.id.desc()).limit(limit)
+        )).unique()
+        return result.scalars().all()
+
     async def get_successful_requests(self) -> list[dict]:
         stmt = (
             select(
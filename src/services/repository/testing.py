@@ -1,6 +1,82 @@
+from itertools import groupby
+from uuid import UUID
+
+from sqlalchemy import select, update, func
+from sqlalchemy.engine import Row
+
 from src.models import tables
 from src.services.repository.base import BaseRepository
 
 
 class TestingRepo(BaseRepository[tables.Testing]):
     table = tables.Testing
+
+    async def update(self, id: UUID, **kwargs) -> tables.Testing | None:
+        if not kwargs:
+            return await self.get(id=id)
+
+        stmt = (
+            update(self.table)
+            .where(self.table.id == id)
+            .values(**kwargs)
+            .returning(self.table)
+            .execution_options(populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        await self._session.commit()
+        return result.scalars().first()
+
+    async def get_all_for_vacancies(self, vacancy_ids: list[UUID]) -> dict[UUID, list[tables.Testing]]:
+        """
+        Тестирования сразу нескольких вакансий одним запросом
+        (dataloader для списков вакансий вместо N+1)
+
+        :param vacancy_ids: id вакансий
+        :return: словарь vacancy_id -> тестирования
+        """
+        if not vacancy_ids:
+            return {}
+
+        stmt = (
+            select(self.table)
+            .where(self.table.vacancy_id.in_(vacancy_ids))
+            .order_by(self.table.vacancy_id)
+        )
+        rows = (await self._session.execute(stmt)).scalars().all()
+        return {
+            vacancy_id: list(testings)
+            for vacancy_id, testings in groupby(rows, key=lambda testing: testing.vacancy_id)
+        }
+
+    async def get_with_vacancy_and_first_attempt(
+            self,
+            testing_id: UUID,
+            user_id: UUID
+    ) -> Row | None:
+        first_attempt_created_at = (
+            select(tables.Attempt.created_at)
+            .where(
+                tables.Attempt.user_id == user_id,
+                tables.Attempt.test_id == self.table.id
+            )
+            .order_by(tables.Attempt.created_at)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+        # Дедлайн считается на стороне БД: NULL (нет попыток) в Python ложь.
+        # Наружу уходит только готовый boolean, без datetime-объектов
+        expired = func.now() > (
+            first_attempt_created_at + func.make_interval(0, 0, 0, tables.Vacancy.test_time)
+        )
+
+        stmt = (
+            select(
+                self.table,
+                tables.Vacancy,
+                expired.label("expired")
+            )
+            .join(tables.Vacancy, tables.Vacancy.id == self.table.vacancy_id, isouter=True)
+            .where(self.table.id == testing_id)
+        )
+        return (await self._session.execute(stmt)).first()
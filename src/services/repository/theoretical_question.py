@@ -1,4 +1,8 @@
-from sqlalchemy import select, text
+from uuid import UUID
+
+from sqlalchemy import UUID as UUIDType
+from sqlalchemy import select, text, func, and_, case, column, literal, values
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import joinedload
 
 from src.models import tables
@@ -27,3 +31,57 @@ class TheoreticalQuestionRepo(BaseRepository[tables.TheoreticalQuestion]):
 
         result = (await self._session.execute(req.order_by(text(order_by)).limit(limit).offset(offset))).unique()
         return result.scalars().all()
+
+    async def score(self, testing_id: UUID, answers: list[tuple[UUID, UUID]]) -> Row:
+        """
+        Подсчитывает результат тестирования одним запросом
+
+        :param testing_id: id тестирования
+        :param answers: пары (question_id, answer_option_id)
+        :return: Row(correct, matched, total)
+        """
+        total = (
+            select(func.count())
+            .where(self.table.testing_id == testing_id)
+            .scalar_subquery()
+        )
+
+        if not answers:
+            stmt = select(
+                literal(0).label("correct"),
+                literal(0).label("matched"),
+                total.label("total"),
+            )
+            return (await self._session.execute(stmt)).first()
+
+        answer_rows = values(
+            column("question_id", UUIDType(as_uuid=True)),
+            column("answer_option_id", UUIDType(as_uuid=True)),
+            name="answers"
+        ).data(answers)
+
+        stmt = (
+            select(
+                func.coalesce(
+                    func.sum(case((tables.AnswerOption.is_correct, 1), else_=0)), 0
+                ).label("correct"),
+                func.count(tables.AnswerOption.id).label("matched"),
+                total.label("total"),
+            )
+            .select_from(answer_rows)
+            .join(
+                tables.AnswerOption,
+                and_(
+                    tables.AnswerOption.id == answer_rows.c.answer_option_id,
+                    tables.AnswerOption.question_id == answer_rows.c.question_id
+                )
+            )
+            .join(
+                self.table,
+                and_(
+                    self.table.id == tables.AnswerOption.question_id,
+                    self.table.testing_id == testing_id
+                )
+            )
+        )
+        return (await self._session.execute(stmt)).first()
@@ -1,3 +1,7 @@
+import asyncio
+import time
+import uuid
+
 from sqlalchemy import select, text, func, or_, and_
 from sqlalchemy.orm import subqueryload
 
@@ -8,6 +12,41 @@ from .base import BaseRepository
 class VacancyRepo(BaseRepository[tables.Vacancy]):
     table = tables.Vacancy
 
+    # Небольшой in-process кэш горячих вакансий: состояние вакансии меняется
+    # редко относительно трафика тестирований, поэтому короткого TTL достаточно
+    _cache: dict[uuid.UUID, tuple[float, tables.Vacancy]] = {}
+    _cache_lock = asyncio.Lock()
+    _cache_ttl = 2.0
+    _cache_maxsize = 1024
+
+    async def get(self, **kwargs) -> tables.Vacancy | None:
+        if set(kwargs) != {"id"}:
+            return await super().get(**kwargs)
+
+        vacancy_id = kwargs["id"]
+        async with self._cache_lock:
+            entry = self._cache.get(vacancy_id)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+        vacancy = await super().get(**kwargs)
+        if vacancy is not None:
+            async with self._cache_lock:
+                if len(self._cache) >= self._cache_maxsize:
+                    self._cache.clear()
+                self._cache[vacancy_id] = (time.monotonic() + self._cache_ttl, vacancy)
+        return vacancy
+
+    async def update(self, id: uuid.UUID, **kwargs) -> None:
+        await super().update(id, **kwargs)
+        async with self._cache_lock:
+            self._cache.pop(id, None)
+
+    async def delete(self, id: uuid.UUID) -> None:
+        await super().delete(id)
+        async with self._cache_lock:
+            self._cache.pop(id, None)
+
     async def search(
             self,
             query: str,
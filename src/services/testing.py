@@ -1,14 +1,16 @@
 import base64
 import uuid
-from datetime import datetime, timedelta
-from typing import Literal
+from dataclasses import dataclass
+from datetime import datetime
 from urllib.parse import urljoin
 
 from fastapi import BackgroundTasks
+from pydantic import TypeAdapter
 
 from src import exceptions
 from src.config import Config
 from src.models import schemas
+from src.models import tables
 from src.models.auth import BaseUser
 from src.models.language import ProgramLanguage
 from src.models.permission import Permission
@@ -20,6 +22,39 @@ from src.services.repository import AttemptRepo, VacancyRepo, PracticalQuestionR
 from src.services.repository import TestingRepo
 from src.utils.aiohttp_client import AiohttpClient
 
+# Валидаторы списков собираются один раз на импорт модуля,
+# чтобы pydantic-core сам итерировал строки БД
+_ATTEMPT_TEST_LIST = TypeAdapter(list[schemas.AttemptTest])
+_TESTING_LIST = TypeAdapter(list[schemas.Testing])
+_PRACTICAL_QUESTION_LIST = TypeAdapter(list[schemas.PracticalQuestion])
+_THEORETICAL_QUESTION_LIST = TypeAdapter(list[schemas.TheoreticalQuestion])
+_APPROVED_REQUESTS_LIST = TypeAdapter(list[schemas.ApprovedRequests])
+
+_TEST_TYPE_NAMES = {
+    TestType.PRACTICAL: "практическим",
+    TestType.THEORETICAL: "теоретическим",
+}
+
+
+@dataclass(slots=True)
+class _TestingContext:
+    testing: tables.Testing
+    vacancy: tables.Vacancy
+
+
+def _encode_attempt_cursor(created_at: datetime, attempt_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{attempt_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8")
+
+
+def _decode_attempt_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8")
+        created_at, attempt_id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(attempt_id)
+    except (ValueError, UnicodeDecodeError) as error:
+        raise exceptions.BadRequest("Неверный курсор") from error
+
 
 class TestingApplicationService:
 
@@ -47,22 +82,67 @@ class TestingApplicationService:
         self._theoretical_question_repo = theoretical_question_repo
         self._answer_option_repo = answer_option_repo
 
+    async def _load_testing_context(
+            self,
+            testing_id: uuid.UUID,
+            *,
+            test_type: TestType = None,
+            check_deadline: bool = False
+    ) -> _TestingContext:
+        """
+        Общая преамбула обработчиков тестирования: загружает тестирование
+        с вакансией, проверяет их наличие, тип тестирования и что вакансия
+        открыта; при check_deadline дополнительно проверяет дедлайн первой
+        попытки текущего пользователя
+
+        :param testing_id: id тестирования
+        :param test_type: требуемый тип тестирования
+        :param check_deadline: проверять ли дедлайн прохождения
+        :return:
+
+        """
+        if check_deadline:
+            row = await self._repo.get_with_vacancy_and_first_attempt(testing_id, user_id=self._current_user.id)
+            if not row:
+                raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
+
+            testing, vacancy, expired = row
+        else:
+            testing = await self._repo.get(id=testing_id)
+            if not testing:
+                raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
+
+            vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
+            expired = False
+
+        if test_type is not None and testing.type != test_type:
+            raise exceptions.BadRequest(f"Тестирование с id:{testing_id} не является {_TEST_TYPE_NAMES[test_type]}")
+
+        if not vacancy:
+            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
+
+        if vacancy.state != VacancyState.OPENED:
+            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
+
+        if expired:
+            raise exceptions.BadRequest(f"Время прохождения теста истекло")
+
+        return _TestingContext(testing=testing, vacancy=vacancy)
+
     @permission_filter(Permission.GET_SELF_TEST_RESULTS)
     @state_filter(UserState.ACTIVE)
     async def get_test_attempts(
             self,
             testing_id: uuid.UUID = None,
-            page: int = 1,
+            cursor: str = None,
             per_page: int = 10,
-            order_by: Literal["title", "created_at"] = "created_at",
-    ) -> list[schemas.AttemptTest]:
+    ) -> schemas.AttemptTestPage:
         """
         Получить список попыток прохождения теста текущего пользователя
 
         :param testing_id: id тестирования
-        :param page: номер страницы (всегда >= 1)
-        :param per_page: количество статей на странице (всегда >= 1, но <= per_page_limit)
-        :param order_by: поле сортировки
+        :param cursor: курсор последней попытки предыдущей страницы
+        :param per_page: количество попыток на странице (всегда >= 1, но <= per_page_limit)
         :return:
 
         """
@@ -72,33 +152,46 @@ class TestingApplicationService:
             if not testing:
                 raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
 
-        if page < 1:
-            raise exceptions.NotFound("Страница не найдена")
         if per_page < 1:
             raise exceptions.BadRequest("Неверное количество элементов на странице")
 
         per_page_limit = 40
 
         # Подготовка входных данных
-        per_page = min(per_page, per_page_limit, 2147483646)
-        offset = min((page - 1) * per_page, 2147483646)
+        per_page = min(per_page, per_page_limit)
+        after = _decode_attempt_cursor(cursor) if cursor else None
 
         # Выполнение запроса
-        attempts = await self._attempt_repo.get_all(
-            limit=per_page,
-            offset=offset,
-            order_by=order_by,
-            as_full=True,
-            user_id=self._current_user.id,
-            **{"test_id": testing_id} if testing_id else {}
+        if testing_id:
+            attempts = await self._attempt_repo.get_page(
+                limit=per_page,
+                after=after,
+                as_full=True,
+                user_id=self._current_user.id,
+                test_id=testing_id
+            )
+        else:
+            attempts = await self._attempt_repo.get_page(
+                limit=per_page,
+                after=after,
+                as_full=True,
+                user_id=self._current_user.id
+            )
+
+        next_cursor = None
+        if len(attempts) == per_page:
+            next_cursor = _encode_attempt_cursor(attempts[-1].created_at, attempts[-1].id)
+
+        return schemas.AttemptTestPage(
+            items=_ATTEMPT_TEST_LIST.validate_python(attempts),
+            next_cursor=next_cursor,
         )
-        return [schemas.AttemptTest.model_validate(attempt) for attempt in attempts]
 
     @permission_filter(Permission.GET_USER_TEST_RESULTS)
     @state_filter(UserState.ACTIVE)
     async def get_approved_users(self) -> list[schemas.ApprovedRequests]:
         requests = await self._attempt_repo.get_successful_requests()
-        return [schemas.ApprovedRequests.model_validate(request) for request in requests]
+        return _APPROVED_REQUESTS_LIST.validate_python(requests)
 
     @permission_filter(Permission.START_TESTING)
     @state_filter(UserState.ACTIVE)
@@ -110,39 +203,10 @@ class TestingApplicationService:
         :return:
 
         """
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        if testing.type != TestType.PRACTICAL:
-            raise exceptions.BadRequest(f"Тестирование с id:{testing_id} не является практическим")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
-
-        first_attempt = await self._attempt_repo.get_first(
-            user_id=self._current_user.id,
-            test_id=testing_id
-        )
-
-        if first_attempt:
-            time_now = datetime.now().replace(tzinfo=None)
-            time_deadline = (first_attempt.created_at + timedelta(days=vacancy.test_time)).replace(tzinfo=None)
-
-            if time_now > time_deadline:
-                raise exceptions.BadRequest(f"Время прохождения теста истекло")
+        await self._load_testing_context(testing_id, test_type=TestType.PRACTICAL, check_deadline=True)
 
         questions = await self._practical_question_repo.get_all(testing_id=testing_id)
-        response = []
-        for question in questions:
-            model = schemas.PracticalQuestion.model_validate(question)
-            # model.answer = None
-            response.append(model)
-        return response
+        return _PRACTICAL_QUESTION_LIST.validate_python(questions)
 
     @permission_filter(Permission.START_TESTING)
     @state_filter(UserState.ACTIVE)
@@ -155,39 +219,13 @@ class TestingApplicationService:
 
         """
         # Проверка наличия тестирования
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        if testing.type != TestType.THEORETICAL:
-            raise exceptions.BadRequest(f"Тестирование с id:{testing_id} не является теоретическим")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
-
-        first_attempt = await self._attempt_repo.get_first(
-            user_id=self._current_user.id,
-            test_id=testing_id
-        )
-
-        if first_attempt:
-            time_now = datetime.now().replace(tzinfo=None)
-            time_deadline = (first_attempt.created_at + timedelta(days=vacancy.test_time)).replace(tzinfo=None)
-
-            if time_now > time_deadline:
-                raise exceptions.BadRequest(f"Время прохождения теста истекло")
+        await self._load_testing_context(testing_id, test_type=TestType.THEORETICAL, check_deadline=True)
 
         questions = await self._theoretical_question_repo.get_all(testing_id=testing_id, as_full=True)
-        response = []
-        for question in questions:
-            model = schemas.TheoreticalQuestion.model_validate(question)
-            for option in model.answer_options:
+        response = _THEORETICAL_QUESTION_LIST.validate_python(questions)
+        for question in response:
+            for option in question.answer_options:
                 option.is_correct = None
-            response.append(model)
 
         return response
 
@@ -207,70 +245,30 @@ class TestingApplicationService:
 
         """
         # Проверка наличия тестирования
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        if testing.type != TestType.THEORETICAL:
-            raise exceptions.BadRequest(f"Тестирование с id:{testing_id} не является теоретическим")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
-
-        first_attempt = await self._attempt_repo.get_first(
-            user_id=self._current_user.id,
-            test_id=testing_id
-        )
-
-        if first_attempt:
-            time_now = datetime.now().replace(tzinfo=None)
-            time_deadline = (first_attempt.created_at + timedelta(days=vacancy.test_time)).replace(tzinfo=None)
-            if time_now > time_deadline:
-                raise exceptions.BadRequest(f"Время прохождения теста истекло")
-
-        questions = await self._theoretical_question_repo.get_all(testing_id=testing_id, as_full=True)
-
-        # Hashing
-        questions_hash = {}
-        for question in questions:
-            option_hash = {}
-            for option in question.answer_options:
-                option_hash[option.id] = option
-            questions_hash[question.id] = option_hash
+        ctx = await self._load_testing_context(testing_id, test_type=TestType.THEORETICAL, check_deadline=True)
 
         # Проверка ответов
-        correct_answers = 0
-        for answer in answers:
-            options = questions_hash.get(answer.question_id)
-            if options is None:
-                raise exceptions.BadRequest(f"Вопрос с id:{answer.question_id} не найден")
-
-            option = options.get(answer.answer_option_id)
-            if option is None:
-                raise exceptions.BadRequest(f"Вариант ответа с id:{answer.answer_option_id} не найден")
-
-            if option.is_correct:
-                correct_answers += 1
+        correct_answers, matched_answers, all_questions = await self._theoretical_question_repo.score(
+            testing_id=testing_id,
+            answers=[(answer.question_id, answer.answer_option_id) for answer in answers]
+        )
 
-        all_questions = len(questions)
+        if matched_answers != len(answers):
+            raise exceptions.BadRequest("Получен ответ на несуществующий вопрос или вариант ответа")
 
         if all_questions == 0:
             user_percent = 0
         else:
             user_percent = int((correct_answers * 100) / all_questions)
 
-        attempt = schemas.AttemptTest.model_validate(
+        attempt = schemas.Attempt.model_validate(
             await self._attempt_repo.create(
                 percent=user_percent,
                 user_id=self._current_user.id,
                 test_id=testing_id,
             )
         )
-        return schemas.AttemptTest(**attempt.model_dump(exclude={"test"}), test=schemas.Testing.model_validate(testing))
+        return schemas.AttemptTest.model_construct(**attempt.__dict__, test=schemas.Testing.model_validate(ctx.testing))
 
     @permission_filter(Permission.COMPLETE_TESTING)
     @state_filter(UserState.ACTIVE)
@@ -291,35 +289,11 @@ class TestingApplicationService:
 
         """
         # Проверка наличия тестирования
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        if testing.type != TestType.PRACTICAL:
-            raise exceptions.BadRequest(f"Тестирование с id:{testing_id} не является практическим")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
-
-        first_attempt = await self._attempt_repo.get_first(
-            user_id=self._current_user.id,
-            test_id=testing_id
-        )
-
-        if first_attempt:
-            time_now = datetime.now().replace(tzinfo=None)
-            time_deadline = (first_attempt.created_at + timedelta(days=vacancy.test_time)).replace(tzinfo=None)
-
-            if time_now > time_deadline:
-                raise exceptions.BadRequest(f"Время прохождения теста истекло")
+        ctx = await self._load_testing_context(testing_id, test_type=TestType.PRACTICAL, check_deadline=True)
 
         questions = await self._practical_question_repo.get_all(testing_id=testing_id)
 
-        attempt = schemas.AttemptTest.model_validate(
+        attempt = schemas.Attempt.model_validate(
             await self._attempt_repo.create(
                 percent=0,
                 user_id=self._current_user.id,
@@ -338,7 +312,7 @@ class TestingApplicationService:
             attempt.id
         )
 
-        return schemas.AttemptTest(**attempt.model_dump(exclude={"test"}), test=schemas.Testing.model_validate(testing))
+        return schemas.AttemptTest.model_construct(**attempt.__dict__, test=schemas.Testing.model_validate(ctx.testing))
 
     @permission_filter(Permission.CREATE_TESTING)
     @state_filter(UserState.ACTIVE)
@@ -369,19 +343,9 @@ class TestingApplicationService:
         :return:
 
         """
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
+        await self._load_testing_context(testing_id)
 
-        await self._repo.update(testing_id, **data.model_dump(exclude_unset=True))
-        testing = await self._repo.get(id=testing_id)
+        testing = await self._repo.update(testing_id, **data.model_dump(exclude_unset=True))
         return schemas.Testing.model_validate(testing)
 
     @permission_filter(Permission.DELETE_TESTING)
@@ -394,16 +358,7 @@ class TestingApplicationService:
         :return:
 
         """
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
+        await self._load_testing_context(testing_id)
         # todo
         await self._repo.delete(id=testing_id)
 
@@ -417,18 +372,8 @@ class TestingApplicationService:
         :return:
 
         """
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
-
-        return schemas.Testing.model_validate(testing)
+        ctx = await self._load_testing_context(testing_id)
+        return schemas.Testing.model_validate(ctx.testing)
 
     @permission_filter(Permission.GET_TESTING)
     @state_filter(UserState.ACTIVE)
@@ -442,7 +387,24 @@ class TestingApplicationService:
         """
 
         testings = await self._repo.get_all(vacancy_id=vacancy_id)
-        return [schemas.Testing.model_validate(testing) for testing in testings]
+        return _TESTING_LIST.validate_python(testings)
+
+    @permission_filter(Permission.GET_TESTING)
+    @state_filter(UserState.ACTIVE)
+    async def get_testings_bulk(self, vacancy_ids: list[uuid.UUID]) -> dict[uuid.UUID, list[schemas.Testing]]:
+        """
+        Получить списки тестирований сразу для нескольких вакансий
+
+        :param vacancy_ids: id вакансий
+        :return:
+
+        """
+
+        testings = await self._repo.get_all_for_vacancies(vacancy_ids)
+        return {
+            vacancy_id: _TESTING_LIST.validate_python(rows)
+            for vacancy_id, rows in testings.items()
+        }
 
     @permission_filter(Permission.UPDATE_TESTING)
     @state_filter(UserState.ACTIVE)
@@ -459,18 +421,9 @@ class TestingApplicationService:
         :return:
 
         """
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
+        ctx = await self._load_testing_context(testing_id)
 
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
-
-        if testing.type != TestType.PRACTICAL:
+        if ctx.testing.type != TestType.PRACTICAL:
             raise exceptions.BadRequest(f"Тестирование с id:{testing_id} не является практическим")
 
         question = await self._practical_question_repo.create(**data.model_dump(), testing_id=testing_id)
@@ -491,18 +444,9 @@ class TestingApplicationService:
         :return:
 
         """
-        testing = await self._repo.get(id=testing_id)
-        if not testing:
-            raise exceptions.NotFound(f"Тестирование с id:{testing_id} не найдено")
-
-        vacancy = await self._vacancy_repo.get(id=testing.vacancy_id)
-        if not vacancy:
-            raise exceptions.NotFound(f"Вакансия с id:{testing.vacancy_id} не найдена")
-
-        if vacancy.state != VacancyState.OPENED:
-            raise exceptions.BadRequest(f"Вакансия с id:{testing.vacancy_id} не открыта")
+        ctx = await self._load_testing_context(testing_id)
 
-        if testing.type != TestType.THEORETICAL:
+        if ctx.testing.type != TestType.THEORETICAL:
             raise exceptions.BadRequest(f"Тестирование с id:{testing_id} не является теоретическим")
 
         _ = await self._theoretical_question_repo.create(**data.model_dump(), testing_id=testing_id)
@@ -653,7 +597,7 @@ class TestingApplicationService:
 
         """
         questions = await self._practical_question_repo.get_all(testing_id=testing_id)
-        return [schemas.PracticalQuestion.model_validate(question) for question in questions]
+        return _PRACTICAL_QUESTION_LIST.validate_python(questions)
 
     @permission_filter(Permission.UPDATE_TESTING)
     @state_filter(UserState.ACTIVE)
@@ -666,7 +610,7 @@ class TestingApplicationService:
 
         """
         questions = await self._theoretical_question_repo.get_all(testing_id=testing_id, as_full=True)
-        return [schemas.TheoreticalQuestion.model_validate(question) for question in questions]
+        return _THEORETICAL_QUESTION_LIST.validate_python(questions)
 
     @staticmethod
     async def __checking_practical_answers(
@@ -55,13 +55,13 @@ class VacancyApplicationService:
 
         if (
                 state != VacancyState.OPENED and
-                Permission.GET_PRIVATE_VACANCY.value not in self._current_user.permissions
+                not self._current_user.permission_mask & Permission.GET_PRIVATE_VACANCY
         ):
             raise exceptions.AccessDenied("Вы не можете получить список приватных вакансий")
 
         if (
                 state == VacancyState.OPENED and
-                Permission.GET_PUBLIC_VACANCY.value not in self._current_user.permissions
+                not self._current_user.permission_mask & Permission.GET_PUBLIC_VACANCY
         ):
             raise exceptions.AccessDenied("Вы не можете получить список публичных вакансий")
 
@@ -97,13 +97,13 @@ class VacancyApplicationService:
 
         if (
                 vacancy.state != VacancyState.OPENED and
-                Permission.GET_PRIVATE_VACANCY.value not in self._current_user.permissions
+                not self._current_user.permission_mask & Permission.GET_PRIVATE_VACANCY
         ):
             raise exceptions.AccessDenied("Вакансия не найдена")
 
         if (
                 vacancy.state == VacancyState.OPENED and
-                Permission.GET_PUBLIC_VACANCY.value not in self._current_user.permissions
+                not self._current_user.permission_mask & Permission.GET_PUBLIC_VACANCY
         ):
             raise exceptions.AccessDenied("Вы не можете получить публичную вакансию")
 
@@ -172,13 +172,13 @@ class VacancyApplicationService:
 
         if (
                 vacancy.state != VacancyState.OPENED and
-                Permission.GET_PRIVATE_VACANCY.value not in self._current_user.permissions
+                not self._current_user.permission_mask & Permission.GET_PRIVATE_VACANCY
         ):
             raise exceptions.AccessDenied("Вы не можете просматривать файлы закрытых вакансий")
 
         if (
                 vacancy.state == VacancyState.OPENED and
-                Permission.GET_PUBLIC_VACANCY.value not in self._current_user.permissions
+                not self._current_user.permission_mask & Permission.GET_PUBLIC_VACANCY
         ):
             raise exceptions.AccessDenied("Вы не можете просматривать файлы публичных вакансий")
 
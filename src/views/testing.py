@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from .base import BaseView
 from src.models import schemas
 
@@ -6,6 +8,10 @@ class TestingsResponse(BaseView):
     content: list[schemas.Testing]
 
 
+class TestingsBulkResponse(BaseView):
+    content: dict[UUID, list[schemas.Testing]]
+
+
 class TestingResponse(BaseView):
     content: schemas.Testing
 
@@ -15,7 +21,7 @@ class AttemptTestResponse(BaseView):
 
 
 class AttemptsTestResponse(BaseView):
-    content: list[schemas.AttemptTest]
+    content: schemas.AttemptTestPage
 
 
 class PracticalQuestionResponse(BaseView):